@@ -48,9 +48,10 @@ load_hive_task = PythonOperator(
     dag=dag,
 )
 
-# === Task 3: Compliance rule check 
+# === Task 3: Compliance rule check (served by compliance_service.py when it is running,
+# otherwise the client evaluates the rules in-process; see README)
 def run_compliance_check():
-    subprocess.run(["python3", "/PATH_TO/pipeline_tasks/compliance_monitor.py"], check=True)
+    subprocess.run(["python3", "/PATH_TO/pipeline_tasks/compliance_client.py", "run"], check=True)
 
 compliance_task = PythonOperator(
     task_id="run_compliance_checks",
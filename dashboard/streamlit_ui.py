@@ -34,9 +34,9 @@ def parse_compliance_log():
                 violations.append(line.strip().replace("[ALERT] ", ""))
     return {"dq": dq, "violations": violations}
 
-# Run compliance monitor
-def run_monitor():
-    result = subprocess.run(["python", "pipeline_tasks/compliance_monitor.py"], capture_output=True, text=True)
+# Run compliance monitor through the resident service (falls back to an in-process run)
+def run_monitor(backend="hive"):
+    result = subprocess.run(["python", "pipeline_tasks/compliance_client.py", "run", "--backend", backend], capture_output=True, text=True)
     with open(COMPLIANCE_LOG, "w") as f:
         f.write(result.stdout)
     return result.stdout
@@ -47,9 +47,10 @@ st.markdown("Monitor data quality, policy violations, and GDPR/PDPD compliance a
 
 col1, col2 = st.columns([2, 1])
 with col2:
+    backend = st.selectbox("Compliance backend", ["hive", "mongo"], help="MongoDB gives faster interactive runs on the ingested copy.")
     if st.button("Run Compliance Monitor"):
         st.info("Running compliance monitor...")
-        run_monitor()
+        run_monitor(backend)
         st.success("Compliance monitor completed!")
 
 rules = load_rules()
@@ -0,0 +1,83 @@
+import sys
+import json
+import argparse
+from urllib import request, error
+from urllib.parse import quote, urlencode
+
+# Must match compliance_service.py. Only stdlib is imported here so the
+# client starts quickly; compliance_monitor is imported on fallback only.
+SERVICE_URL = "http://127.0.0.1:8765"
+# No read timeout by default: a full Hive run can take many minutes and the
+# service runs requests one at a time, so a run may also queue behind another.
+TIMEOUT = None
+
+def call_service(method, path, url=SERVICE_URL, timeout=TIMEOUT):
+    req = request.Request(f"{url}{path}", method=method)
+    try:
+        with request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except error.HTTPError as e:
+        try:
+            message = json.loads(e.read() or b"{}").get("error")
+        except json.JSONDecodeError:
+            message = None
+        raise RuntimeError(message or f"HTTP {e.code}")
+    except TimeoutError:
+        raise RuntimeError(f"Compliance service at {url} timed out after {timeout}s")
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Invalid response from compliance service: {e}")
+
+def run_rules(backend="hive", rule_id=None, url=SERVICE_URL, timeout=TIMEOUT):
+    path = f"/run/{quote(rule_id, safe='')}" if rule_id else "/run"
+    return call_service("POST", f"{path}?{urlencode({'backend': backend})}", url, timeout)
+
+def get_last_result(url=SERVICE_URL, timeout=TIMEOUT):
+    return call_service("GET", "/last", url, timeout)
+
+def run_local(backend, rule_id=None):
+    # Cold path: the service is not running, so evaluate in this process
+    import compliance_monitor
+
+    rules = compliance_monitor.load_rules()
+    if rule_id:
+        rules = [r for r in rules if r["id"] == rule_id]
+        if not rules:
+            raise RuntimeError(f"Unknown rule: {rule_id}")
+    dq_results = {"student_checkpoint": "SKIPPED", "grades_checkpoint": "SKIPPED"}
+    violations = compliance_monitor.check_compliance(rules, backend=backend)
+    return {"report": compliance_monitor.format_summary(dq_results, violations, len(rules))}
+
+def main():
+    parser = argparse.ArgumentParser(description="Client for the resident compliance service.")
+    parser.add_argument("--url", default=SERVICE_URL,
+                        help=f"Compliance service URL (default: {SERVICE_URL})")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                        help="Seconds to wait for the service to answer (default: no limit)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="Run all compliance rules, or one with --rule")
+    run_parser.add_argument("--rule", help="Rule id from rules.yaml")
+    run_parser.add_argument("--backend", choices=["hive", "mongo"], default="hive")
+    run_parser.add_argument("--no-fallback", action="store_true",
+                            help="Fail instead of running in-process when the service is down")
+    sub.add_parser("last", help="Print the last result held by the service")
+    args = parser.parse_args()
+
+    try:
+        try:
+            if args.command == "run":
+                result = run_rules(args.backend, args.rule, args.url, args.timeout)
+            else:
+                result = get_last_result(args.url, args.timeout)
+        except error.URLError as e:
+            if args.command == "last" or args.no_fallback:
+                raise RuntimeError(f"Compliance service unavailable at {args.url}: {e.reason}")
+            print("[WARN] Compliance service unavailable, running in-process.")
+            result = run_local(args.backend, args.rule)
+    except (RuntimeError, ConnectionError) as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    print(result["report"])
+
+if __name__ == "__main__":
+    main()
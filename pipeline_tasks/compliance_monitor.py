@@ -1,15 +1,19 @@
 import os
+import sys
+import argparse
 import subprocess
 import pandas as pd
 import yaml
-import pexpect
-from great_expectations.data_context import get_context
 
 # Hive CLI-based Configuration
 HIVE_DB = "university_data"
 GE_DIR = os.path.abspath("great_expectations")
 RULES_FILE = "compliance_rules/rules.yaml"
 
+# MongoDB Configuration (collections and indexes created by ingest_data.py)
+MONGO_URI = "mongodb://localhost:27017/"
+MONGO_DB = "university_data"
+
 def query_hive(sql: str) -> pd.DataFrame:
     try:
         full_cmd = f"hive -e \"USE {HIVE_DB}; {sql}\""
@@ -39,7 +43,27 @@ def query_hive(sql: str) -> pd.DataFrame:
         print(f"[ERROR] Hive query failed: {e}")
         return pd.DataFrame()
 
+def get_mongo_db():
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    # Fail once up front rather than letting every rule time out and report 0
+    try:
+        client.admin.command("ping")
+    except PyMongoError as e:
+        raise ConnectionError(f"MongoDB unreachable at {MONGO_URI}: {e}") from e
+    return client[MONGO_DB]
+
+def count_mongo(db, collection: str, pipeline: list) -> int:
+    print(f"[QUERY] Aggregating on {collection}: {str(pipeline)[:100]}...")
+    result = list(db[collection].aggregate(pipeline + [{"$count": "n"}]))
+    return result[0]["n"] if result else 0
+
 def run_data_quality_checks():
+    # Imported here so runs that skip DQ checks don't pay for great_expectations
+    from great_expectations.data_context import get_context
+
     print("\n[INFO] Running Great Expectations Hive checkpoints...\n")
     context = get_context(context_root_dir=GE_DIR)
     results = {}
@@ -81,7 +105,10 @@ def load_rules():
     with open(RULES_FILE, "r") as f:
         return yaml.safe_load(f)["rules"]
 
-def check_compliance(rules):
+def check_compliance(rules, backend="hive", mongo_db=None):
+    if backend == "mongo":
+        return check_compliance_mongo(rules, db=mongo_db)
+
     print("\n[INFO] Evaluating compliance rules on Hive...\n")
     violations = []
 
@@ -137,20 +164,112 @@ def check_compliance(rules):
 
     return violations
 
-def main():
-    dq_results = {"student_checkpoint": "SKIPPED", "grades_checkpoint": "SKIPPED"}
-    rules = load_rules()
-    compliance_violations = check_compliance(rules)
+def check_compliance_mongo(rules, db=None):
+    print("\n[INFO] Evaluating compliance rules on MongoDB...\n")
+    if db is None:
+        db = get_mongo_db()
+    violations = []
 
-    print("\n==== COMPLIANCE SUMMARY ====")
+    for rule in rules:
+        table = rule["table"]
+        if rule["type"] == "not_null":
+            for col in rule["fields"]:
+                # CSV blanks are loaded by pandas as NaN rather than null
+                nulls = count_mongo(db, table, [
+                    {"$match": {col: {"$in": [None, float("nan")]}}},
+                ])
+                if nulls > 0:
+                    violations.append(f"{col} in {table} has {nulls} NULL values.")
+        elif rule["type"] == "value_check":
+            cond = rule["condition"]
+            # Like Hive's `!=`, missing/NULL values are not counted
+            n = count_mongo(db, table, [
+                {"$match": {cond["field"]: {
+                    "$ne": cond["required_value"],
+                    "$exists": True,
+                    "$nin": [None, float("nan")],
+                }}},
+            ])
+            if n > 0:
+                violations.append(f"{rule['name']} violated: {n} records without consent.")
+        elif rule["type"] == "access_policy":
+            cond = rule["condition"]
+            # Served by the (table_name, role, query_time) index on access_logs.
+            # Like Hive's NOT IN, missing/NULL roles are not counted.
+            n = count_mongo(db, table, [
+                {"$match": {
+                    "table_name": rule["filter_table"],
+                    cond["field"]: {
+                        "$exists": True,
+                        "$nin": cond["allowed_values"] + [None, float("nan")],
+                    },
+                }},
+            ])
+            if n > rule["violation_threshold"]["max_violations_per_day"]:
+                violations.append(f"{rule['name']} breached: unauthorized access logged.")
+        elif rule["type"] == "range_check":
+            for col in rule["fields"]:
+                n = count_mongo(db, table, [
+                    {"$match": {"$or": [
+                        {col: {"$lt": rule["threshold"]["min"]}},
+                        {col: {"$gt": rule["threshold"]["max"]}},
+                    ]}},
+                ])
+                if n > 0:
+                    violations.append(f"{rule['name']} found {n} {col} outliers.")
+        elif rule["type"] == "uniqueness":
+            for col in rule["fields"]:
+                n = count_mongo(db, table, [
+                    {"$group": {"_id": f"${col}", "cnt": {"$sum": 1}}},
+                    {"$match": {"cnt": {"$gt": 1}}},
+                ])
+                if n > 0:
+                    violations.append(f"Duplicate {col} detected: {n} duplicates.")
+        elif rule["type"] == "join_check":
+            join = rule["join_condition"]
+            # Each $lookup probes the student_id index on the right collection
+            n = count_mongo(db, join["left_table"], [
+                {"$project": {join["left_key"]: 1}},
+                {"$lookup": {
+                    "from": join["right_table"],
+                    "localField": join["left_key"],
+                    "foreignField": join["right_key"],
+                    "as": "matches",
+                }},
+                {"$match": {"matches": {"$size": 0}}},
+            ])
+            if n > 0:
+                violations.append(f"{rule['name']} failed: {n} students missing consent logs.")
+
+    return violations
+
+def format_summary(dq_results, violations, rule_count):
+    lines = ["", "==== COMPLIANCE SUMMARY ===="]
     for cp, passed in dq_results.items():
-        print(f"[DQ] {cp}: {'OK' if passed else 'FAILED'}")
-    for v in compliance_violations:
-        print(f"[ALERT] {v}")
+        lines.append(f"[DQ] {cp}: {'OK' if passed else 'FAILED'}")
+    for v in violations:
+        lines.append(f"[ALERT] {v}")
+    lines.append(f"[SUMMARY] {len(violations)} of {rule_count} compliance rules violated.")
+    lines.append("=============================\n")
+    return "\n".join(lines)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run compliance rules against Hive or MongoDB.")
+    parser.add_argument("--backend", choices=["hive", "mongo"], default="hive",
+                        help="Where to evaluate compliance rules (default: hive)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    dq_results = {"student_checkpoint": "SKIPPED", "grades_checkpoint": "SKIPPED"}
+    rules = load_rules()
+    try:
+        compliance_violations = check_compliance(rules, backend=args.backend)
+    except ConnectionError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
 
-    print(f"[SUMMARY] {len(compliance_violations)} of {len(rules)} compliance rules violated.")
-    
-    print("=============================\n")
+    print(format_summary(dq_results, compliance_violations, len(rules)))
 
 if __name__ == "__main__": 
     main()   
\ No newline at end of file
@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+import compliance_monitor
+
+# Resident Compliance Service Configuration
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+DQ_RESULTS = {"student_checkpoint": "SKIPPED", "grades_checkpoint": "SKIPPED"}
+
+class UnknownRuleError(Exception):
+    pass
+
+class ComplianceState:
+    """
+    Warm state shared by all requests: parsed rules, the MongoDB session and the last result.
+    The Hive backend still starts one `hive -e` process per query (see query_hive).
+    Runs are serialized by `lock`, so concurrent requests wait for the current run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rules = None
+        self.rules_mtime = None
+        self.mongo_db = None
+        self.last_result = None
+
+    def get_rules(self):
+        # Re-parse rules.yaml only when it changes on disk
+        mtime = os.path.getmtime(compliance_monitor.RULES_FILE)
+        if self.rules is None or mtime != self.rules_mtime:
+            print(f"[INFO] Loading rules from {compliance_monitor.RULES_FILE}")
+            self.rules = compliance_monitor.load_rules()
+            self.rules_mtime = mtime
+        return self.rules
+
+    def get_mongo_db(self):
+        if self.mongo_db is None:
+            self.mongo_db = compliance_monitor.get_mongo_db()
+        return self.mongo_db
+
+    def run(self, backend="hive", rule_id=None):
+        with self.lock:
+            rules = self.get_rules()
+            if rule_id is not None:
+                rules = [r for r in rules if r["id"] == rule_id]
+                if not rules:
+                    raise UnknownRuleError(rule_id)
+
+            mongo_db = self.get_mongo_db() if backend == "mongo" else None
+            start = time.time()
+            violations = compliance_monitor.check_compliance(rules, backend=backend, mongo_db=mongo_db)
+
+            self.last_result = {
+                "backend": backend,
+                "rule_id": rule_id,
+                "rules_checked": len(rules),
+                "violations": violations,
+                "dq": DQ_RESULTS,
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "duration_seconds": round(time.time() - start, 3),
+                "report": compliance_monitor.format_summary(DQ_RESULTS, violations, len(rules)),
+            }
+            return self.last_result
+
+state = ComplianceState()
+
+class ComplianceRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health            -> service status
+    GET  /last              -> last compliance result (404 if nothing has run yet)
+    POST /run?backend=mongo -> run all rules
+    POST /run/<rule_id>     -> run a single rule
+    """
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self.send_json(200, {"status": "ok", "rules_loaded": state.rules is not None})
+        elif path == "/last":
+            if state.last_result is None:
+                self.send_json(404, {"error": "No compliance run yet."})
+            else:
+                self.send_json(200, state.last_result)
+        else:
+            self.send_json(404, {"error": f"Unknown path: {path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        if not parts or parts[0] != "run" or len(parts) > 2:
+            self.send_json(404, {"error": f"Unknown path: {url.path}"})
+            return
+
+        backend = parse_qs(url.query).get("backend", ["hive"])[0]
+        if backend not in ("hive", "mongo"):
+            self.send_json(400, {"error": f"Unknown backend: {backend}"})
+            return
+
+        rule_id = unquote(parts[1]) if len(parts) == 2 else None
+        try:
+            status, payload = 200, state.run(backend=backend, rule_id=rule_id)
+        except UnknownRuleError:
+            status, payload = 404, {"error": f"Unknown rule: {rule_id}"}
+        except Exception as e:
+            print(f"[ERROR] Compliance run failed: {e}")
+            status, payload = 500, {"error": str(e)}
+
+        try:
+            self.send_json(status, payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up while the run was in progress; the result is still in /last
+            print("[WARN] Client disconnected before the compliance result was sent.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident compliance service on localhost.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    args = parser.parse_args()
+
+    state.get_rules()
+    server = ThreadingHTTPServer((args.host, args.port), ComplianceRequestHandler)
+    print(f"[INFO] Compliance service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[INFO] Shutting down compliance service.")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()